@@ -0,0 +1,293 @@
+"""Batch clipping of drawn geometry against the game window.
+
+clip_segments() runs the Cohen-Sutherland steps of cohen_sutherland_clip()
+on many segments at once with NumPy, in the same edge order so the results
+match exactly. Each pass resolves one window edge for every segment that
+is still undecided, so a batch needs at most four passes however many
+segments it holds. NumPy only pays off for batches of hundreds of
+segments, more than a frame ever holds, so clip_polygons() passes outlines
+that are inside the window straight through and clips the rest per
+segment unless there are BATCH_MIN_SEGMENTS of them.
+
+Check the batch routines against the per-segment reference and time a
+frame's worth of clipping with:
+
+    python clipping.py
+"""
+import math
+import sys
+import time
+
+import numpy as np
+
+# Clipping window
+X_MIN, X_MAX = -400, 400
+Y_MIN, Y_MAX = -300, 300
+
+# Outcodes
+INSIDE = 0
+LEFT = 1
+RIGHT = 2
+BOTTOM = 4
+TOP = 8
+
+# Below this many segments NumPy's per-call overhead outweighs the batch,
+# so clip_polygons() uses the per-segment routine
+BATCH_MIN_SEGMENTS = 512
+
+
+def compute_outcodes(x, y):
+    code = np.where(x < X_MIN, LEFT, np.where(x > X_MAX, RIGHT, INSIDE))
+    return code | np.where(y < Y_MIN, BOTTOM, np.where(y > Y_MAX, TOP, INSIDE))
+
+
+def clip_segments(segments):
+    """Clip an (N, 4) array-like of x1, y1, x2, y2 rows.
+
+    Returns the clipped (N, 4) float array and a boolean mask of the
+    segments that are at least partly inside the window; rows outside the
+    mask are meaningless.
+    """
+    segments = np.array(segments, dtype=float).reshape(-1, 4)
+    x1, y1, x2, y2 = segments.T  # Views, so updates land in segments
+    outcode1 = compute_outcodes(x1, y1)
+    outcode2 = compute_outcodes(x2, y2)
+    accept = np.zeros(len(segments), dtype=bool)
+    active = np.ones(len(segments), dtype=bool)
+
+    while True:
+        inside = active & (outcode1 == 0) & (outcode2 == 0)
+        accept |= inside
+        active &= ~inside & ((outcode1 & outcode2) == 0)
+        idx = np.nonzero(active)[0]
+        if not len(idx):
+            break
+
+        first = outcode1[idx] != 0
+        outcode = np.where(first, outcode1[idx], outcode2[idx])
+        ax1, ay1, ax2, ay2 = x1[idx], y1[idx], x2[idx], y2[idx]
+        x = np.empty(len(idx))
+        y = np.empty(len(idx))
+
+        # Edge priority per segment: top, bottom, right, left
+        top = (outcode & TOP) != 0
+        bottom = ~top & ((outcode & BOTTOM) != 0)
+        right = ~top & ~bottom & ((outcode & RIGHT) != 0)
+        left = ~top & ~bottom & ~right
+        for mask, bound in ((top, Y_MAX), (bottom, Y_MIN)):
+            x[mask] = ax1[mask] + (ax2[mask] - ax1[mask]) * \
+                (bound - ay1[mask]) / (ay2[mask] - ay1[mask])
+            y[mask] = bound
+        for mask, bound in ((right, X_MAX), (left, X_MIN)):
+            y[mask] = ay1[mask] + (ay2[mask] - ay1[mask]) * \
+                (bound - ax1[mask]) / (ax2[mask] - ax1[mask])
+            x[mask] = bound
+
+        moved = idx[first]
+        x1[moved], y1[moved] = x[first], y[first]
+        outcode1[moved] = compute_outcodes(x1[moved], y1[moved])
+        moved = idx[~first]
+        x2[moved], y2[moved] = x[~first], y[~first]
+        outcode2[moved] = compute_outcodes(x2[moved], y2[moved])
+
+    return segments, accept
+
+
+def clip_outline(points):
+    """Clip one closed outline segment by segment with
+    cohen_sutherland_clip() and stitch the visible pieces back together"""
+    outline = []
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        clipped = cohen_sutherland_clip(x1, y1, x2, y2)
+        if clipped:
+            (cx1, cy1), (cx2, cy2) = clipped
+            if not outline or outline[-1] != (cx1, cy1):
+                outline.append((cx1, cy1))
+            outline.append((cx2, cy2))
+    if outline:
+        outline.append(outline[0])  # Close the polygon
+    return outline
+
+
+def clip_polygons(polygons):
+    """Clip closed outlines (vertex lists whose last point repeats the first).
+
+    The visible pieces of each outline are stitched back in order, the way
+    draw_ball() always has, and closed again. Outlines entirely inside the
+    window, the usual case, pass straight through. The rest go through
+    clip_outline(), or one clip_segments() call once they add up to
+    BATCH_MIN_SEGMENTS edges. Returns one vertex list per polygon, empty
+    when nothing of it is visible.
+    """
+    outlines = [[] for _ in polygons]
+    pending = []
+    edge_count = 0
+    for index, polygon in enumerate(polygons):
+        points = list(polygon)
+        if len(points) < 2:
+            continue
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        if X_MIN <= min(xs) and max(xs) <= X_MAX and \
+                Y_MIN <= min(ys) and max(ys) <= Y_MAX:
+            # Every edge is accepted unchanged, so stitching gives back the
+            # outline itself
+            outlines[index] = points + points[:1]
+        else:
+            pending.append((index, points))
+            edge_count += len(points) - 1
+
+    if edge_count < BATCH_MIN_SEGMENTS:
+        for index, points in pending:
+            outlines[index] = clip_outline(points)
+        return outlines
+
+    clipped, visible = clip_segments(
+        [(*p1, *p2) for _, points in pending for p1, p2 in zip(points, points[1:])])
+    clipped = clipped.tolist()
+    visible = visible.tolist()
+    start = 0
+    for index, points in pending:
+        outline = []
+        for i in range(start, start + len(points) - 1):
+            if visible[i]:
+                cx1, cy1, cx2, cy2 = clipped[i]
+                if not outline or outline[-1] != (cx1, cy1):
+                    outline.append((cx1, cy1))
+                outline.append((cx2, cy2))
+        if outline:
+            outline.append(outline[0])  # Close the polygon
+        outlines[index] = outline
+        start += len(points) - 1
+    return outlines
+
+
+def compute_outcode(x, y):
+    code = INSIDE
+    if x < X_MIN:
+        code |= LEFT
+    elif x > X_MAX:
+        code |= RIGHT
+    if y < Y_MIN:
+        code |= BOTTOM
+    elif y > Y_MAX:
+        code |= TOP
+    return code
+
+
+def cohen_sutherland_clip(x1, y1, x2, y2):
+    """Per-segment reference that clip_segments() must match; returns the
+    clipped endpoints, or None when the segment is outside the window"""
+    outcode1 = compute_outcode(x1, y1)
+    outcode2 = compute_outcode(x2, y2)
+    accept = False
+    done = False
+
+    while not done:
+        if outcode1 == 0 and outcode2 == 0:
+            accept = True
+            done = True
+        elif outcode1 & outcode2 != 0:
+            done = True
+        else:
+            outcode = outcode1 if outcode1 != 0 else outcode2
+            if outcode & TOP:
+                x = x1 + (x2 - x1) * (Y_MAX - y1) / (y2 - y1)
+                y = Y_MAX
+            elif outcode & BOTTOM:
+                x = x1 + (x2 - x1) * (Y_MIN - y1) / (y2 - y1)
+                y = Y_MIN
+            elif outcode & RIGHT:
+                y = y1 + (y2 - y1) * (X_MAX - x1) / (x2 - x1)
+                x = X_MAX
+            elif outcode & LEFT:
+                y = y1 + (y2 - y1) * (X_MIN - x1) / (x2 - x1)
+                x = X_MIN
+
+            if outcode == outcode1:
+                x1, y1 = x, y
+                outcode1 = compute_outcode(x1, y1)
+            else:
+                x2, y2 = x, y
+                outcode2 = compute_outcode(x2, y2)
+
+    if accept:
+        return (x1, y1), (x2, y2)
+    return None
+
+
+def random_segments(rng, count):
+    """Random segments weighted toward the awkward cases: crossing corners,
+    entirely outside, vertical and horizontal"""
+    span = rng.uniform(-1000, 1000, (count, 4))
+    corners = np.array([[X_MIN, Y_MIN], [X_MIN, Y_MAX], [X_MAX, Y_MIN], [X_MAX, Y_MAX]])
+    near = corners[rng.integers(0, 4, count)]
+    corner = np.hstack((near, near)) + rng.uniform(-60, 60, (count, 4))
+    outside = span.copy()
+    outside[:, [0, 2]] = np.abs(outside[:, [0, 2]]) + X_MAX  # Both right of the window
+    vertical = span.copy()
+    vertical[:, 2] = vertical[:, 0]
+    horizontal = span.copy()
+    horizontal[:, 3] = horizontal[:, 1]
+    kinds = rng.integers(0, 5, count)
+    return np.choose(kinds[:, None], (span, corner, outside, vertical, horizontal))
+
+
+def check(count=100_000, seed=0):
+    """Compare the batch routines with the per-segment reference. Returns
+    the number of mismatches."""
+    rng = np.random.default_rng(seed)
+    segments = random_segments(rng, count)
+    clipped, visible = clip_segments(segments)
+    mismatches = 0
+    for segment, result, accepted in zip(segments.tolist(), clipped.tolist(), visible.tolist()):
+        expected = cohen_sutherland_clip(*segment)
+        actual = (tuple(result[:2]), tuple(result[2:])) if accepted else None
+        if actual != expected:
+            mismatches += 1
+
+    # Ball-sized and paddle-sized outlines around the window edges
+    polygons = []
+    for _ in range(count // 100):
+        x, y = rng.uniform(-450, 450), rng.uniform(-350, 350)
+        radius = rng.choice([5, 50])
+        angles = np.linspace(0, 2 * np.pi, rng.integers(4, 30), endpoint=False)
+        points = [(x + radius * math.cos(a), y + radius * math.sin(a)) for a in angles]
+        polygons.append(points + points[:1])
+    for polygon, outline in zip(polygons, clip_polygons(polygons)):
+        if outline != clip_outline(polygon):
+            mismatches += 1
+    return mismatches
+
+
+def benchmark(repeats=20_000):
+    """Seconds to clip a frame's ball and paddle outlines with
+    clip_polygons() and with clip_outline() alone, with the ball inside the
+    window and across its right edge"""
+    ball = [(5 * math.cos(a), 100 + 5 * math.sin(a))
+            for a in np.linspace(0, 2 * np.pi, 28, endpoint=False)]
+    ball.append(ball[0])
+    paddle = [(-50, -260), (-50, -240), (50, -240), (50, -260), (-50, -260)]
+    frames = {"inside": [ball, paddle],
+              "edge": [[(x + 398, y) for x, y in ball], paddle]}
+    results = {}
+    for name, polygons in frames.items():
+        start = time.perf_counter()
+        for _ in range(repeats):
+            clip_polygons(polygons)
+        batch = (time.perf_counter() - start) / repeats
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for polygon in polygons:
+                clip_outline(polygon)
+        results[name] = (batch, (time.perf_counter() - start) / repeats)
+    return results
+
+
+if __name__ == "__main__":
+    mismatches = check()
+    print(f"{mismatches} mismatches against cohen_sutherland_clip()")
+    for name, (batch, reference) in benchmark().items():
+        print(f"{name:>6} frame: clip_polygons {batch * 1e6:.1f} us, "
+              f"per-segment {reference * 1e6:.1f} us")
+    sys.exit(1 if mismatches else 0)
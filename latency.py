@@ -0,0 +1,90 @@
+"""Input-to-photon latency log for the nose-tracked paddle.
+
+Run the game with BREAKOUT_LATENCY_LOG=latency.csv to record, for every
+camera frame that moves the paddle, when it was captured, when inference
+finished, when move_paddle() applied it and when screen.update() pushed it
+to the canvas. The capture time is the camera driver's own buffer timestamp
+where OpenCV exposes one (V4L2), so "total" includes frames waiting in the
+driver; other backends fall back to when cap.read() returned, which leaves
+that wait out. Then report per-stage percentiles and histograms with:
+
+    python latency.py latency.csv
+"""
+import sys
+
+# (name, start column, end column)
+STAGES = [
+    ("tracker", "capture", "inference"),
+    ("queue", "inference", "paddle"),
+    ("render", "paddle", "render"),
+    ("total", "capture", "render"),
+]
+COLUMNS = ["frame_id", "capture", "inference", "paddle", "render"]
+HISTOGRAM_BINS = 10
+HISTOGRAM_WIDTH = 40
+
+
+class LatencyLog:
+    """Appends one CSV row of perf_counter() timestamps per tracked frame"""
+
+    def __init__(self, path):
+        self.file = open(path, "w")
+        self.file.write(",".join(COLUMNS) + "\n")
+
+    def record(self, frame_id, capture, inference, paddle, render):
+        self.file.write(
+            f"{frame_id},{capture:.6f},{inference:.6f},{paddle:.6f},{render:.6f}\n")
+
+    def close(self):
+        self.file.close()
+
+
+def load(path):
+    rows = []
+    with open(path) as f:
+        header = f.readline().strip().split(",")
+        for line in f:
+            values = line.strip().split(",")
+            if len(values) == len(header):
+                rows.append(dict(zip(header, map(float, values))))
+    return rows
+
+
+def percentile(sorted_values, p):
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def histogram(sorted_values):
+    low, high = sorted_values[0], sorted_values[-1]
+    width = (high - low) / HISTOGRAM_BINS or 1
+    counts = [0] * HISTOGRAM_BINS
+    for value in sorted_values:
+        counts[min(HISTOGRAM_BINS - 1, int((value - low) / width))] += 1
+    peak = max(counts)
+    lines = []
+    for i, count in enumerate(counts):
+        bar = "#" * (count * HISTOGRAM_WIDTH // peak)
+        lines.append(f"  {low + i * width:8.2f} ms | {bar} {count}")
+    return lines
+
+
+def report(rows):
+    print(f"{len(rows)} frames")
+    for name, start, end in STAGES:
+        values = sorted((row[end] - row[start]) * 1000 for row in rows)
+        print(f"\n{name} ({start} -> {end}): "
+              f"p50 {percentile(values, 50):.2f} ms  "
+              f"p95 {percentile(values, 95):.2f} ms  "
+              f"p99 {percentile(values, 99):.2f} ms")
+        for line in histogram(values):
+            print(line)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python latency.py LOG_FILE")
+    rows = load(sys.argv[1])
+    if not rows:
+        sys.exit("No latency samples recorded")
+    report(rows)
@@ -1,55 +1,264 @@
-import turtle
 import random
 import math
 import pygame.mixer
 import time
 import os
+# BREAKOUT_DISPLAY=pygame swaps turtle/Tk for a pygame surface renderer with
+# the same API (see pygame_display.py)
+DISPLAY_BACKEND = os.environ.get("BREAKOUT_DISPLAY", "turtle")
+if DISPLAY_BACKEND == "pygame":
+    import pygame_display as turtle
+else:
+    import turtle
+import sys
 import cv2
 import mediapipe as mp
 import threading
+from clipping import clip_polygons
+from latency import LatencyLog
+import spectator
+from recorder import VideoRecorder, RecorderError
+import snapshot
+from soak import SoakMonitor, SOAK_FRAME_TIME
 
 
-class NoseTracker:
+# Nose tracking backends, from cheapest to most accurate
+TRACKER_BACKENDS = ["detection", "mesh", "mesh_refined"]
+TRACKER_MODE = os.environ.get("BREAKOUT_TRACKER", "auto")
+TRACKER_LATENCY_BUDGET = 0.015  # Seconds per inference allowed in auto mode
+TRACKER_BENCHMARK_FRAMES = 10  # Timed frames per backend at startup
+TRACKER_SLOW_FRAMES = 30  # Frames over budget before auto mode steps down
+CAPTURE_STAMP_MAX_AGE = 1.0  # Older driver timestamps are taken to be bogus
+NOSE_GAIN = 2  # Paddle pixels per nose pixel on a 640 px wide camera
+
+# Soak testing (see soak.py): play unattended for this many simulated seconds
+SOAK_SECONDS = float(os.environ.get("BREAKOUT_SOAK", 0))
+AUTOPILOT_SPEED = 300  # Paddle pixels per second, slow enough to miss sometimes
+
+
+class FaceDetectionBackend:
+    """Short-range face detector; only reports six coarse keypoints"""
+
     def __init__(self):
-        self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
+        self.detector = mp.solutions.face_detection.FaceDetection(
+            model_selection=0,
+            min_detection_confidence=0.5)
+
+    def process(self, image):
+        results = self.detector.process(image)
+        if results.detections:
+            # Nose tip is keypoint 2
+            nose = results.detections[0].location_data.relative_keypoints[2]
+            return nose.x, nose.y
+        return None
+
+    def close(self):
+        self.detector.close()
+
+
+class FaceMeshBackend:
+    """FaceMesh with 468 landmarks, or 478 with refine_landmarks"""
+
+    def __init__(self, refine_landmarks):
+        self.face_mesh = mp.solutions.face_mesh.FaceMesh(
             max_num_faces=1,
-            refine_landmarks=True,
+            refine_landmarks=refine_landmarks,
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5)
+
+    def process(self, image):
+        results = self.face_mesh.process(image)
+        if results.multi_face_landmarks:
+            # Nose tip is landmark 4
+            nose = results.multi_face_landmarks[0].landmark[4]
+            return nose.x, nose.y
+        return None
+
+    def close(self):
+        self.face_mesh.close()
+
+
+def create_tracker_backend(name):
+    if name == "detection":
+        return FaceDetectionBackend()
+    if name == "mesh":
+        return FaceMeshBackend(refine_landmarks=False)
+    if name == "mesh_refined":
+        return FaceMeshBackend(refine_landmarks=True)
+    raise ValueError(f"Unknown tracker backend: {name}")
+
+
+class NoseTracker:
+    def __init__(self, mode=TRACKER_MODE):
+        self.mode = mode
+        self.backend_name = None
+        self.backend = None
+        if mode != "auto":
+            self._use_backend(mode)
+        self.inference_time = 0.0  # Smoothed seconds per inference
+        self.slow_frames = 0
         self.nose_position = None
+        # (nose_x, frame_id, capture time, inference done time)
+        self.nose_sample = None
+        self.frame_id = 0
+        self.captured_at = None
+        # Reused every frame: the capture buffer and its RGB conversion
+        self.frame = None
+        self.rgb = None
+        self.frame_width = 640  # Updated from the first captured frame
+        self.min_interval = 0.0  # Seconds between inferences, set by the governor
         self.cap = cv2.VideoCapture(0)
         self.running = True
         self.thread = threading.Thread(target=self._track_nose)
         self.thread.daemon = True
         self.thread.start()
 
+    def _use_backend(self, name):
+        if self.backend:
+            self.backend.close()
+        self.backend = create_tracker_backend(name)
+        self.backend_name = name
+        self.inference_time = 0.0
+        self.slow_frames = 0
+
+    def _read_frame(self):
+        """Capture and convert into preallocated buffers. The image is not
+        mirrored; _track_nose mirrors the nose coordinates instead."""
+        success, frame = self.cap.read(self.frame)
+        if not success:
+            return None
+        self.captured_at = self._capture_time()
+        if self.rgb is None or self.rgb.shape != frame.shape:
+            self.frame = frame
+            self.rgb = frame.copy()
+            self.frame_width = frame.shape[1]
+        self.rgb.flags.writeable = True
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.rgb)
+        self.rgb.flags.writeable = False  # Lets mediapipe skip a copy
+        return self.rgb
+
+    def _capture_time(self):
+        """When the driver captured the frame just read, on the perf_counter()
+        clock. V4L2 stamps buffers with CLOCK_MONOTONIC, which includes time
+        spent queued in the driver; backends without a usable stamp fall back
+        to when read() returned."""
+        now = time.perf_counter()
+        age = time.monotonic() - self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+        if 0 <= age < CAPTURE_STAMP_MAX_AGE:
+            return now - age
+        return now
+
+    def _select_backend(self):
+        """Time every backend on live frames and keep the most accurate one
+        that fits TRACKER_LATENCY_BUDGET, falling back to the cheapest"""
+        chosen = TRACKER_BACKENDS[0]
+        for name in TRACKER_BACKENDS:
+            backend = create_tracker_backend(name)
+            timings = []
+            # One extra untimed frame absorbs model warm-up
+            while self.running and self.cap.isOpened() and len(timings) <= TRACKER_BENCHMARK_FRAMES:
+                image = self._read_frame()
+                if image is None:
+                    continue
+                start = time.perf_counter()
+                backend.process(image)
+                timings.append(time.perf_counter() - start)
+            backend.close()
+            if not timings:
+                break
+            timings = timings[1:] or timings
+            median = sorted(timings)[len(timings) // 2]
+            print(f"Tracker benchmark: {name} {median * 1000:.1f} ms")
+            if median <= TRACKER_LATENCY_BUDGET:
+                chosen = name
+        self._use_backend(chosen)
+        print(f"Tracker backend: {chosen}")
+
+    def _record_inference_time(self, elapsed):
+        self.inference_time = elapsed if not self.inference_time else \
+            0.9 * self.inference_time + 0.1 * elapsed
+        if self.mode != "auto":
+            return
+        if self.inference_time > TRACKER_LATENCY_BUDGET:
+            self.slow_frames += 1
+        else:
+            self.slow_frames = 0
+        index = TRACKER_BACKENDS.index(self.backend_name)
+        if self.slow_frames >= TRACKER_SLOW_FRAMES and index > 0:
+            cheaper = TRACKER_BACKENDS[index - 1]
+            print(f"Tracker over budget ({self.inference_time * 1000:.1f} ms), "
+                  f"switching to {cheaper}")
+            self._use_backend(cheaper)
+
     def _track_nose(self):
+        if self.backend is None:
+            self._select_backend()
+        last_inference = 0.0
         while self.running and self.cap.isOpened():
-            success, image = self.cap.read()
-            if not success:
+            image = self._read_frame()
+            if image is None:
                 continue
-
-            image = cv2.cvtColor(cv2.flip(image, 1), cv2.COLOR_BGR2RGB)
-            image.flags.writeable = False
-            results = self.face_mesh.process(image)
-
-            if results.multi_face_landmarks:
-                face_landmarks = results.multi_face_landmarks[0]
-                # Nose tip is landmark 4
-                nose = face_landmarks.landmark[4]
+            if self.captured_at - last_inference < self.min_interval:
+                continue  # Keep draining the camera but skip inference
+            last_inference = self.captured_at
+            self.frame_id += 1
+            captured_at = self.captured_at
+
+            start = time.perf_counter()
+            nose = self.backend.process(image)
+            inferred_at = time.perf_counter()
+            self._record_inference_time(inferred_at - start)
+
+            if nose:
                 h, w = image.shape[:2]
-                self.nose_position = (int(nose.x * w), int(nose.y * h))
+                # Mirror x, as if the image had been flipped like a mirror
+                self.nose_position = (int((1 - nose[0]) * w), int(nose[1] * h))
+                self.nose_sample = (self.nose_position[0], self.frame_id,
+                                    captured_at, inferred_at)
 
     def get_nose_x_position(self):
         if self.nose_position:
             return self.nose_position[0]
         return None
 
+    def get_nose_sample(self):
+        return self.nose_sample
+
     def stop(self):
         self.running = False
         self.thread.join()
         self.cap.release()
+        if self.backend:
+            self.backend.close()
+
+
+class AutopilotTracker:
+    """Stands in for NoseTracker in soak runs, steering the paddle toward the
+    ball through the same nose-sample path as the camera"""
+
+    def __init__(self):
+        self.x = 0
+        self.frame_id = 0
+        self.frame_width = 640
+        self.min_interval = 0.0
+
+    def get_nose_sample(self):
+        step = AUTOPILOT_SPEED * SOAK_FRAME_TIME
+        self.x += max(-step, min(step, ball_center[0] - self.x))
+        self.frame_id += 1
+        now = time.perf_counter()
+        return (self.get_nose_x_position(), self.frame_id, now, now)
+
+    def get_nose_x_position(self):
+        # Invert the nose-to-screen mapping in game_loop
+        return self.frame_width / 2 + self.x * self.frame_width / (NOSE_GAIN * 640)
+
+    def stop(self):
+        pass
+
+
+def create_tracker():
+    return AutopilotTracker() if SOAK_SECONDS else NoseTracker()
 
 
 # Initialize pygame mixer
@@ -66,7 +275,7 @@ try:
 
 except FileNotFoundError as e:
     print(f"Warning: Sound file missing - {e}. Sounds will be disabled.")
-    paddle_hit_sound = brick_break_sound = game_over_sound = game_win_sound = start_game_sound = None
+    paddle_hit_sound = brick_break_sound = game_over_sound = game_win_sound = start_game_sound = intro_sound = None
 
 # Set up the screen
 screen = turtle.Screen()
@@ -84,17 +293,29 @@ except turtle.TurtleGraphicsError:
 # Background starfield
 background_turtle = turtle.Turtle()
 background_turtle.hideturtle()
+background_turtle.setundobuffer(None)
 background_turtle.color("gray20")
 background_turtle.penup()
 background_turtle.speed(0)
-for _ in range(100):
-    x = random.randint(-400, 400)
-    y = random.randint(-300, 300)
-    background_turtle.goto(x, y)
-    background_turtle.dot(2)
+starfield = [(random.randint(-400, 400), random.randint(-300, 300))
+             for _ in range(100)]
+
+
+def set_background_effects(enabled):
+    background_turtle.clear()
+    if enabled:
+        for x, y in starfield:
+            background_turtle.goto(x, y)
+            background_turtle.dot(2)
+
+
+set_background_effects(True)
 
 # intro
+# The intro timeline advances FPS steps per second of wall-clock time, so its
+# pacing no longer depends on how fast frames are actually drawn.
 FPS = 80
+INTRO_STEPS = 120
 PINK = "pink"
 WHITE = "white"
 WIDTH, HEIGHT = 800, 600
@@ -169,16 +390,17 @@ def play_intro_animation(stars):
     time.sleep(1)
     drawer = turtle.Turtle()
     drawer.hideturtle()
+    drawer.setundobuffer(None)
     drawer.speed(0)
 
-    frame = 0
+    start_time = time.perf_counter()
     anim_frame = 0
-    while anim_frame < 120:
+    while anim_frame < INTRO_STEPS:
         screen.update()
         drawer.clear()
 
         for star in stars:
-            star.draw(drawer, frame)
+            star.draw(drawer, anim_frame)
 
         if 30 <= anim_frame < 60:
             for line in nebula_lines:
@@ -192,14 +414,31 @@ def play_intro_animation(stars):
                 if title_frame > letter_start:
                     letter.draw(drawer)
 
-        frame += 1
+        # Sleep until the next step is due; steps missed on a slow machine
+        # are skipped rather than replayed
         anim_frame += 1
-
-        time.sleep(1 / FPS)
-    intro_sound.stop()
+        delay = start_time + anim_frame / FPS - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            anim_frame = int((time.perf_counter() - start_time) * FPS)
+    if intro_sound:
+        intro_sound.stop()
 
 
 life_icons = []
+life_icon_pool = []  # Icon turtles, created once and reused
+
+
+def get_life_icon(i):
+    while len(life_icon_pool) <= i:
+        life = turtle.Turtle()
+        life.hideturtle()
+        life.setundobuffer(None)
+        life.shape("power.gif")  # Your life icon image
+        life.penup()
+        life_icon_pool.append(life)
+    return life_icon_pool[i]
 
 
 def init_life_icons():
@@ -209,12 +448,11 @@ def init_life_icons():
         icon.hideturtle()
     life_icons.clear()
 
-    # Create new icons based on current lives
+    # Show icons based on current lives
     for i in range(lives):
-        life = turtle.Turtle()
-        life.shape("power.gif")  # Your life icon image
-        life.penup()
+        life = get_life_icon(i)
         life.goto(300 + (i * 40), 260)  # Position them more to the left
+        life.showturtle()
         life_icons.append(life)
 
 
@@ -227,20 +465,24 @@ title_display = turtle.Turtle()
 title_display.color("white")
 title_display.penup()
 title_display.hideturtle()
+title_display.setundobuffer(None)
 
 score_display = turtle.Turtle()
 score_display.color("yellow")  # CSS-like text color
 score_display.penup()
 score_display.hideturtle()
+score_display.setundobuffer(None)
 
 button_turtle = turtle.Turtle()  # For drawing buttons
 button_turtle.hideturtle()
+button_turtle.setundobuffer(None)
 button_turtle.color("white", "blue4")  # Border, fill
 button_turtle.penup()
 
 # Paddle
 paddle_turtle = turtle.Turtle()
 paddle_turtle.hideturtle()
+paddle_turtle.setundobuffer(None)
 paddle_turtle.color("white")
 paddle_turtle.fillcolor("white")
 paddle_turtle.penup()
@@ -254,20 +496,24 @@ paddle_vertices = [
 ]
 paddle_center = (0, -250)
 
-# Ball
+# Ball (velocities are in pixels per second)
+BALL_SPEED = 240
 ball_center = [0, 0]
-ball_dx = 4
-ball_dy = -4
+prev_ball_center = (0, 0)  # Physics state before the latest step, for interpolation
+ball_dx = BALL_SPEED
+ball_dy = -BALL_SPEED
 ball_radius = 5
 
 ball_pixels = turtle.Turtle()
 ball_pixels.hideturtle()
+ball_pixels.setundobuffer(None)
 ball_pixels.color("white")
 ball_pixels.fillcolor("white")
 ball_pixels.penup()
 
 # Bricks
 bricks = []
+brick_pool = []  # Brick turtles, created once and reused by every game
 brick_rows = 5
 brick_cols = 10
 brick_width = 70
@@ -279,6 +525,57 @@ brick_start_y = 150
 score = 0
 lives = 3
 
+# Timing: physics runs at a fixed step driven by measured frame time, and
+# rendering interpolates between the last two physics states.
+PHYSICS_DT = 1 / 120  # Seconds per physics step
+MAX_FRAME_TIME = 0.25  # Clamp long stalls instead of replaying them all at once
+FRAME_INTERVAL_MS = 1000 // 144  # Ask Tk for frames at up to 144 Hz
+last_frame_time = None
+physics_accumulator = 0.0
+
+# Quality governor: sheds work in steps while frames cost more than the budget
+FRAME_BUDGET = 1 / 60  # Seconds of game_loop work per frame
+GOVERNOR_WINDOW = 30  # Frames averaged per decision
+GOVERNOR_HEADROOM = 0.6  # Frames under this share of the budget are calm
+GOVERNOR_RESTORE_WINDOWS = 5  # Calm windows in a row before restoring a step
+QUALITY_LEVELS = [
+    {"ball_points": 24, "tracker_interval": 0, "background": True, "hud_interval": 0},
+    {"ball_points": 12, "tracker_interval": 0, "background": True, "hud_interval": 0},
+    {"ball_points": 12, "tracker_interval": 1 / 15, "background": True, "hud_interval": 0},
+    {"ball_points": 8, "tracker_interval": 1 / 15, "background": False, "hud_interval": 0},
+    {"ball_points": 8, "tracker_interval": 1 / 10, "background": False, "hud_interval": 0.25},
+]
+hud_dirty = False
+last_hud_draw = 0.0
+
+# Input-to-photon latency logging (see latency.py)
+LATENCY_LOG_PATH = os.environ.get("BREAKOUT_LATENCY_LOG")
+latency_log = LatencyLog(LATENCY_LOG_PATH) if LATENCY_LOG_PATH else None
+last_logged_frame_id = 0
+
+# Spectator mirroring (see spectator.py)
+SPECTATOR_ADDRESS = os.environ.get("BREAKOUT_SPECTATOR")
+spectator_publisher = spectator.StatePublisher(
+    SPECTATOR_ADDRESS) if SPECTATOR_ADDRESS else None
+
+# Gameplay video export (see recorder.py)
+RECORD_PATH = os.environ.get("BREAKOUT_RECORD")
+video_recorder = None
+if RECORD_PATH:
+    try:
+        video_recorder = VideoRecorder(RECORD_PATH)
+    except RecorderError as e:
+        print(f"Warning: {e}. Recording is disabled.")
+
+# Checkpoints of the running game for instant resume (see snapshot.py)
+SNAPSHOT_PATH = os.environ.get("BREAKOUT_SNAPSHOT")
+CHECKPOINT_INTERVAL = 5  # Seconds of game time between checkpoints
+last_checkpoint = 0.0
+
+soak_monitor = SoakMonitor(
+    SOAK_SECONDS, screen.getcanvas()) if SOAK_SECONDS else None
+game_clock = soak_monitor.clock if soak_monitor else time.perf_counter
+
 
 # Translation functions
 def translate_rectangle(vertices, tx, ty):
@@ -289,72 +586,14 @@ def translate_circle(center_x, center_y, tx, ty):
     return center_x + tx, center_y + ty
 
 
-# Cohen-Sutherland Clipping
-X_MIN, X_MAX = -400, 400
-Y_MIN, Y_MAX = -300, 300
-
-INSIDE = 0
-LEFT = 1
-RIGHT = 2
-BOTTOM = 4
-TOP = 8
-
-
-def compute_outcode(x, y):
-    code = INSIDE
-    if x < X_MIN:
-        code |= LEFT
-    elif x > X_MAX:
-        code |= RIGHT
-    if y < Y_MIN:
-        code |= BOTTOM
-    elif y > Y_MAX:
-        code |= TOP
-    return code
-
-
-def cohen_sutherland_clip(x1, y1, x2, y2):
-    outcode1 = compute_outcode(x1, y1)
-    outcode2 = compute_outcode(x2, y2)
-    accept = False
-    done = False
-
-    while not done:
-        if outcode1 == 0 and outcode2 == 0:
-            accept = True
-            done = True
-        elif outcode1 & outcode2 != 0:
-            done = True
-        else:
-            outcode = outcode1 if outcode1 != 0 else outcode2
-            if outcode & TOP:
-                x = x1 + (x2 - x1) * (Y_MAX - y1) / (y2 - y1)
-                y = Y_MAX
-            elif outcode & BOTTOM:
-                x = x1 + (x2 - x1) * (Y_MIN - y1) / (y2 - y1)
-                y = Y_MIN
-            elif outcode & RIGHT:
-                y = y1 + (y2 - y1) * (X_MAX - x1) / (x2 - x1)
-                x = X_MAX
-            elif outcode & LEFT:
-                y = y1 + (y2 - y1) * (X_MIN - x1) / (x2 - x1)
-                x = X_MIN
-
-            if outcode == outcode1:
-                x1, y1 = x, y
-                outcode1 = compute_outcode(x1, y1)
-            else:
-                x2, y2 = x, y
-                outcode2 = compute_outcode(x2, y2)
-
-    if accept:
-        return (x1, y1), (x2, y2)
-    return None
+def lerp(a, b, t):
+    return a + (b - a) * t
+
 
 # Enhanced Midpoint Circle Algorithm
 
 
-def midpoint_circle(x_center, y_center, radius):
+def midpoint_circle(x_center, y_center, radius, target_points=24):
     pixels = []
     x = 0
     y = radius
@@ -396,8 +635,7 @@ def midpoint_circle(x_center, y_center, radius):
     sorted_pixels = sorted(pixels, key=lambda p: math.atan2(
         p[1] - y_center, p[0] - x_center))
 
-    # Subsample to ~24 points for smoother circle (adjust for small radius)
-    target_points = 24
+    # Subsample to ~target_points points for smoother circle (adjust for small radius)
     step = max(1, len(sorted_pixels) // target_points)
     ordered_pixels = sorted_pixels[::step]
 
@@ -411,45 +649,30 @@ def midpoint_circle(x_center, y_center, radius):
 # Draw paddle
 
 
-def draw_paddle():
+def draw_paddle(clipped_vertices):
     paddle_turtle.clear()
     # print(f"Paddle vertices: {paddle_vertices}")
-    if paddle_vertices:
+    if clipped_vertices:
         paddle_turtle.fillcolor("white")
+        # Start the fill at the first vertex, not wherever the last frame ended
+        paddle_turtle.goto(clipped_vertices[0])
         paddle_turtle.begin_fill()
-        paddle_turtle.goto(paddle_vertices[0])
-        for x, y in paddle_vertices[1:]:
+        for x, y in clipped_vertices[1:]:
             paddle_turtle.goto(x, y)
-        paddle_turtle.goto(paddle_vertices[0])
         paddle_turtle.end_fill()
 
-# Draw ball with Cohen-Sutherland clipping
+# Draw ball from its clipped outline
 
 
-def draw_ball(x, y):
+def draw_ball(clipped_pixels):
     ball_pixels.clear()
-    pixels = midpoint_circle(x, y, ball_radius)
-    if pixels:
-        clipped_pixels = []
-        for i in range(len(pixels) - 1):  # Exclude the last vertex (same as first)
-            x1, y1 = pixels[i]
-            x2, y2 = pixels[i + 1]
-            clipped = cohen_sutherland_clip(x1, y1, x2, y2)
-            if clipped:
-                (cx1, cy1), (cx2, cy2) = clipped
-                if not clipped_pixels or clipped_pixels[-1] != (cx1, cy1):
-                    clipped_pixels.append((cx1, cy1))
-                clipped_pixels.append((cx2, cy2))
-
-        if clipped_pixels:
-            clipped_pixels.append(clipped_pixels[0])  # Close the polygon
-            ball_pixels.fillcolor("white")
-            ball_pixels.begin_fill()
-            ball_pixels.goto(clipped_pixels[0])
-            for px, py in clipped_pixels[1:]:
-                ball_pixels.goto(px, py)
-            ball_pixels.goto(clipped_pixels[0])
-            ball_pixels.end_fill()
+    if clipped_pixels:
+        ball_pixels.fillcolor("white")
+        ball_pixels.goto(clipped_pixels[0])
+        ball_pixels.begin_fill()
+        for px, py in clipped_pixels[1:]:
+            ball_pixels.goto(px, py)
+        ball_pixels.end_fill()
 
 # Draw button
 
@@ -482,17 +705,26 @@ def move_paddle(x, y):
             tx = 350 - paddle_center[0]
         paddle_vertices = translate_rectangle(paddle_vertices, tx, ty)
         paddle_center = (paddle_center[0] + tx, paddle_center[1] + ty)
-        draw_paddle()
+        # Drawn by render_frame() on the next frame
 
 # Initialize bricks
 
 
 def init_bricks():
     global bricks
-    bricks = []
+    if not brick_pool:
+        create_bricks()
+    for brick in brick_pool:
+        brick.showturtle()
+    bricks = list(brick_pool)
+
+
+def create_bricks():
     for row in range(brick_rows):
         for col in range(brick_cols):
             brick = turtle.Turtle()
+            brick.hideturtle()
+            brick.setundobuffer(None)
             brick.shape("square")
             brick.color("red3")
             brick.shapesize(stretch_wid=brick_height/20,
@@ -501,7 +733,8 @@ def init_bricks():
             x = -395 + col * (brick_width + brick_spacing) + brick_width / 2
             y = brick_start_y - row * (brick_height + brick_spacing)
             brick.goto(x, y)
-            bricks.append(brick)
+            brick.index = row * brick_cols + col  # Bit in the alive-mask
+            brick_pool.append(brick)
 
 # Show title screen
 
@@ -532,10 +765,14 @@ def check_button_click(x, y):
             restart_game()
 
 
-def start_game():
-    global game_started, score, lives
+def start_game(resume=None):
+    global game_started, score, lives, last_logged_frame_id
     if not game_started:
         game_started = True
+        if latency_log:
+            # Don't log the sample left over from the title screen
+            sample = nose_tracker.get_nose_sample()
+            last_logged_frame_id = sample[1] if sample else 0
         title_display.clear()
         button_turtle.clear()
         screen.onclick(None)  # Remove title screen click handler
@@ -547,20 +784,22 @@ def start_game():
         # Removed lives from here since we have icons
         score_display.write(f"Score: {score}", font=(
             "Fridericka the Great", 16, "bold"))
-        draw_paddle()
+        if resume:
+            restore_snapshot(resume)
         screen.listen()
         screen.onscreenclick(move_paddle)
         game_loop()
 
 
 def restart_game():
-    global game_started, score, lives, ball_center, ball_dx, ball_dy, last_speed_increase, life_icons, powerups, powerup_turtles
+    global game_started, score, lives, ball_center, prev_ball_center, ball_dx, ball_dy, last_speed_increase, life_icons, powerups, powerup_turtles, life_charges
     game_started = False
     score = 0
     lives = 3
     ball_center = [0, 0]
-    ball_dx = 4
-    ball_dy = -4
+    prev_ball_center = (0, 0)
+    ball_dx = BALL_SPEED
+    ball_dy = -BALL_SPEED
     last_speed_increase = 0
 
     # Clear life icons
@@ -577,16 +816,19 @@ def restart_game():
     bricks.clear()
     screen.onclick(None)
     show_title_screen()
-    nose_tracker.stop()  # Stop the nose tracker when restarting
-    nose_tracker = NoseTracker()
+    # The nose tracker keeps running, so restarts don't reopen the camera
     for powerup in powerups:
-        powerup.turtle.hideturtle()
+        release_sprite(powerup.turtle)
     powerups = []
     powerup_turtles = []
+    for charge in life_charges:
+        if not charge.collected:
+            release_sprite(charge.turtle)
+    life_charges = []
 # Game loop
 
 
-nose_tracker = NoseTracker()
+nose_tracker = create_tracker()
 screen.onscreenclick(None)
 
 #################################################################
@@ -594,24 +836,41 @@ screen.onscreenclick(None)
 #################################################################
 # Add to your constants
 LIFE_CHARGE_SHAPE = "power.gif"  # Your charge icon image
-# Frames between charge spawns (about every 5 seconds at 60fps)
-CHARGE_SPAWN_RATE = 300
-CHARGE_FALL_SPEED = 2  # Pixels per frame
-CHARGE_DURATION = 180
+CHARGE_SPAWN_RATE = 5  # Seconds between charge spawns
+CHARGE_FALL_SPEED = 120  # Pixels per second
+CHARGE_DURATION = 3  # Seconds
 
 # Add to your global variables
 life_charges = []  # Stores active charge objects
-charge_spawn_timer = 0  # Counts frames until next spawn
+charge_spawn_timer = 0  # Counts seconds until next spawn
+sprite_pool = []  # Hidden pickup turtles waiting to be reused
+
+
+def take_sprite(shape):
+    if sprite_pool:
+        sprite = sprite_pool.pop()
+    else:
+        sprite = turtle.Turtle()
+        sprite.hideturtle()
+        sprite.setundobuffer(None)
+        sprite.penup()
+    sprite.shape(shape)
+    return sprite
+
+
+def release_sprite(sprite):
+    sprite.hideturtle()
+    sprite_pool.append(sprite)
 
 
 class LifeCharge:
     def __init__(self):
         self.x = random.randint(-350, 350)
         self.y = 300  # Start at top of screen
-        self.turtle = turtle.Turtle()
-        self.turtle.shape(LIFE_CHARGE_SHAPE)
-        self.turtle.penup()
+        self.prev_y = self.y
+        self.turtle = take_sprite(LIFE_CHARGE_SHAPE)
         self.turtle.goto(self.x, self.y)
+        self.turtle.showturtle()
         self.collected = False
         self.lifetime = CHARGE_DURATION
 
@@ -620,7 +879,7 @@ class LifeCharge:
 ##################### Power Up Code##############################
 ####################################################################
 # Add to your constants section
-POWERUP_SPEED = 3
+POWERUP_SPEED = 180  # Pixels per second
 POWERUP_CHANCE = 0.3  # 30% chance to spawn when life lost
 POWERUP_SHAPE = "powerup.gif"  # Your power-up image
 
@@ -637,12 +896,11 @@ def update_life_display():
         icon.hideturtle()
     life_icons.clear()
 
-    # Create new icons based on current lives
+    # Show icons based on current lives
     for i in range(lives):
-        life = turtle.Turtle()
-        life.shape("power.gif")  # Your life icon image
-        life.penup()
+        life = get_life_icon(i)
         life.goto(350 + (i * 40), 260)  # Position them at top right
+        life.showturtle()
         life_icons.append(life)
 
     # Update the text display (optional - can remove if using only icons)
@@ -664,11 +922,11 @@ class PowerUp:
     def __init__(self):
         self.x = random.randint(-350, 350)
         self.y = 300  # Start at top
+        self.prev_y = self.y
         self.speed = POWERUP_SPEED
-        self.turtle = turtle.Turtle()
-        self.turtle.shape(POWERUP_SHAPE)
-        self.turtle.penup()
+        self.turtle = take_sprite(POWERUP_SHAPE)
         self.turtle.goto(self.x, self.y)
+        self.turtle.showturtle()
         self.active = True
 
 
@@ -685,19 +943,19 @@ def lose_life():
     # flash_screen()
 
 
-def update_powerups():
+def update_powerups(dt):
     global powerups, powerup_turtles
 
     to_remove = []
 
     for i, powerup in enumerate(powerups):
         if powerup.active:
-            powerup.y -= powerup.speed
-            powerup.turtle.goto(powerup.x, powerup.y)
+            powerup.prev_y = powerup.y
+            powerup.y -= powerup.speed * dt
 
             # Remove if fallen off screen
             if powerup.y < -300:
-                powerup.turtle.hideturtle()
+                release_sprite(powerup.turtle)
                 to_remove.append(i)
 
     # Remove inactive power-ups
@@ -721,7 +979,7 @@ def check_powerup_collisions():
             # Collected power-up!
             lives = min(lives + 1, 3)  # Cap at max lives
             update_life_display()
-            powerup.turtle.hideturtle()
+            release_sprite(powerup.turtle)
             to_remove.append(i)
 
             # Play collection sound if available
@@ -734,7 +992,7 @@ def check_powerup_collisions():
         powerup_turtles.pop(i)
 
 
-def update_charges():
+def update_charges(dt):
     """Move all active charges downward"""
     global life_charges
 
@@ -742,12 +1000,12 @@ def update_charges():
 
     for i, charge in enumerate(life_charges):
         if not charge.collected:
-            charge.y -= CHARGE_FALL_SPEED
-            charge.turtle.goto(charge.x, charge.y)
+            charge.prev_y = charge.y
+            charge.y -= CHARGE_FALL_SPEED * dt
 
             # Remove if fallen off screen
             if charge.y < -320:
-                charge.turtle.hideturtle()
+                release_sprite(charge.turtle)
                 charges_to_remove.append(i)
 
     # Remove collected/expired charges
@@ -770,31 +1028,201 @@ def check_charge_collisions():
 
                 # Collected the charge!
                 charge.collected = True
-                charge.turtle.hideturtle()
+                release_sprite(charge.turtle)
                 lives = min(lives + 1, 3)
                 update_life_display()
 
 
-# Frames to wait before allowing another paddle collision
-paddle_collision_cooldown = 10
+PICKUP_HALF_SIZE = 25  # power.gif is 50x50
 
 
-def game_loop():
-    if not game_started:
-        return
-    nose_x = nose_tracker.get_nose_x_position()
-    if nose_x is not None:
-        screen_x = (nose_x - 320) * 2
+def render_frame(alpha, ball_points):
+    """Draw everything between the last two physics states, clipping the
+    ball, paddle and pickup bounds in a single batch"""
+    ball_x = lerp(prev_ball_center[0], ball_center[0], alpha)
+    ball_y = lerp(prev_ball_center[1], ball_center[1], alpha)
+    pickups = powerups + [charge for charge in life_charges if not charge.collected]
+    pickup_positions = [(pickup.x, lerp(pickup.prev_y, pickup.y, alpha))
+                        for pickup in pickups]
 
-        move_paddle(screen_x, 0)  # Move paddle based on nose position
+    outlines = clip_polygons(
+        [midpoint_circle(ball_x, ball_y, ball_radius, ball_points),
+         paddle_vertices + paddle_vertices[:1]] +
+        [sprite_bounds(x, y, PICKUP_HALF_SIZE) for x, y in pickup_positions])
+    draw_ball(outlines[0])
+    draw_paddle(outlines[1])
+    draw_pickups(pickups, pickup_positions, outlines[2:])
+
+
+def draw_hud(now, interval):
+    """Redraw the score if it changed, at most once per interval"""
+    global hud_dirty, last_hud_draw
+    if hud_dirty and now - last_hud_draw >= interval:
+        score_display.clear()
+        score_display.write(f"Score: {score}", font=(
+            "Fridericka the Great", 16, "bold"))
+        hud_dirty = False
+        last_hud_draw = now
 
-    global score, lives, ball_center, ball_dx, ball_dy, last_speed_increase, powerups, powerup_turtles, life_charges, charge_spawn_timer
-    # Update charge spawn timer
 
+class QualityGovernor:
+    """Steps through QUALITY_LEVELS as measured frame cost crosses the budget"""
+
+    def __init__(self):
+        self.level = 0
+        self.frame_costs = []
+        self.calm_windows = 0
+
+    @property
+    def settings(self):
+        return QUALITY_LEVELS[self.level]
+
+    def frame(self, cost):
+        self.frame_costs.append(cost)
+        if len(self.frame_costs) < GOVERNOR_WINDOW:
+            return
+        average = sum(self.frame_costs) / len(self.frame_costs)
+        self.frame_costs.clear()
+        if average > FRAME_BUDGET:
+            self.calm_windows = 0
+            if self.level < len(QUALITY_LEVELS) - 1:
+                self.set_level(self.level + 1)
+        elif average < FRAME_BUDGET * GOVERNOR_HEADROOM and self.level > 0:
+            self.calm_windows += 1
+            if self.calm_windows >= GOVERNOR_RESTORE_WINDOWS:
+                self.calm_windows = 0
+                self.set_level(self.level - 1)
+        else:
+            self.calm_windows = 0
+
+    def set_level(self, level):
+        background = self.settings["background"]
+        self.level = level
+        if self.settings["background"] != background:
+            set_background_effects(self.settings["background"])
+        print(f"Quality level {level}: {self.settings}")
+
+
+quality_governor = QualityGovernor()
+
+
+def sprite_bounds(x, y, half_size):
+    return [(x - half_size, y - half_size), (x - half_size, y + half_size),
+            (x + half_size, y + half_size), (x + half_size, y - half_size),
+            (x - half_size, y - half_size)]
+
+
+def draw_pickups(pickups, positions, outlines):
+    """Move pickup sprites, hiding the ones clipped away entirely"""
+    for pickup, position, outline in zip(pickups, positions, outlines):
+        if outline:
+            pickup.turtle.goto(position)
+            if not pickup.turtle.isvisible():
+                pickup.turtle.showturtle()
+        elif pickup.turtle.isvisible():
+            pickup.turtle.hideturtle()
+
+
+# Seconds to wait before allowing another paddle collision
+paddle_collision_cooldown = 1 / 6
+
+
+def brick_alive_mask():
+    brick_mask = 0
+    for brick in bricks:
+        brick_mask |= 1 << brick.index
+    return brick_mask
+
+
+def current_game_state():
+    """Compact state tuple shared by the spectator stream and video export"""
+    brick_mask = brick_alive_mask()
+    pickups = [(spectator.POWERUP, powerup.x, powerup.y) for powerup in powerups]
+    pickups.extend((spectator.CHARGE, charge.x, charge.y)
+                   for charge in life_charges if not charge.collected)
+    return spectator.game_state(
+        ball_center, paddle_center[0], brick_mask, pickups, score, lives)
+
+
+def take_snapshot():
+    pickups = [(spectator.POWERUP, powerup.x, powerup.y, powerup.prev_y)
+               for powerup in powerups]
+    pickups.extend((spectator.CHARGE, charge.x, charge.y, charge.prev_y)
+                   for charge in life_charges if not charge.collected)
+    return {
+        "ball_center": tuple(ball_center),
+        "ball_dx": ball_dx,
+        "ball_dy": ball_dy,
+        "paddle_x": paddle_center[0],
+        "last_speed_increase": last_speed_increase,
+        "score": score,
+        "lives": lives,
+        "charge_spawn_timer": charge_spawn_timer,
+        "brick_mask": brick_alive_mask(),
+        "pickups": pickups,
+        "rng_state": random.getstate(),
+    }
+
+
+def restore_snapshot(data):
+    """Apply a snapshot to the running game, updating the existing brick,
+    icon and sprite turtles in place instead of recreating them"""
+    global ball_center, prev_ball_center, ball_dx, ball_dy, last_speed_increase, score, lives, paddle_vertices, paddle_center, bricks, powerups, powerup_turtles, life_charges, charge_spawn_timer, hud_dirty, last_frame_time, physics_accumulator
+    ball_center = data["ball_center"]
+    prev_ball_center = ball_center
+    ball_dx = data["ball_dx"]
+    ball_dy = data["ball_dy"]
+    last_speed_increase = data["last_speed_increase"]
+    score = data["score"]
+    lives = data["lives"]
+    charge_spawn_timer = data["charge_spawn_timer"]
+    paddle_vertices = translate_rectangle(
+        paddle_vertices, data["paddle_x"] - paddle_center[0], 0)
+    paddle_center = (data["paddle_x"], paddle_center[1])
+
+    if not brick_pool:
+        create_bricks()
+    bricks = []
+    for brick in brick_pool:
+        if data["brick_mask"] >> brick.index & 1:
+            brick.showturtle()
+            bricks.append(brick)
+        else:
+            brick.hideturtle()
+
+    for powerup in powerups:
+        release_sprite(powerup.turtle)
+    for charge in life_charges:
+        if not charge.collected:
+            release_sprite(charge.turtle)
+    powerups = []
+    powerup_turtles = []
+    life_charges = []
+    for kind, x, y, prev_y in data["pickups"]:
+        pickup = PowerUp() if kind == spectator.POWERUP else LifeCharge()
+        pickup.x, pickup.y, pickup.prev_y = x, y, prev_y
+        pickup.turtle.goto(x, y)
+        if kind == spectator.POWERUP:
+            powerups.append(pickup)
+            powerup_turtles.append(pickup.turtle)
+        else:
+            life_charges.append(pickup)
+
+    init_life_icons()
+    hud_dirty = True
+    last_frame_time = None
+    physics_accumulator = 0.0
+    # Last, since creating pickups above draws from the generator
+    random.setstate(data["rng_state"])
+
+
+def step_physics(dt):
+    global score, lives, ball_center, prev_ball_center, ball_dx, ball_dy, last_speed_increase, hud_dirty
+
+    prev_ball_center = tuple(ball_center)
     ball_center = translate_circle(
-        ball_center[0], ball_center[1], ball_dx, ball_dy)
-    draw_ball(ball_center[0], ball_center[1])
-    update_powerups()
+        ball_center[0], ball_center[1], ball_dx * dt, ball_dy * dt)
+    update_powerups(dt)
     check_powerup_collisions()
 
     # Handle paddle collision
@@ -838,9 +1266,7 @@ def game_loop():
                 last_speed_increase = score
                 print(
                     f"Speed increased! ball_dx: {ball_dx:.2f}, ball_dy: {ball_dy:.2f}, Score: {score}")
-            score_display.clear()
-            score_display.write(f"Score: {score}", font=(
-                "Fridericka the Great", 16, "bold"))
+            hud_dirty = True
             break
 
     if ball_center[1] < -300:
@@ -851,16 +1277,68 @@ def game_loop():
             life_icons[-1].hideturtle()  # Hide the last icon
             life_icons.pop()  # Remove it from the list
 
-        score_display.clear()
-        score_display.write(f"Score: {score}", font=(
-            "Fridericka the Great", 16, "bold"))
+        hud_dirty = True
         ball_center = translate_circle(
             ball_center[0], ball_center[1], -ball_center[0], -ball_center[1])
-        ball_dx = random.choice([4, -4]) * \
+        prev_ball_center = ball_center  # Don't interpolate across the reset
+        ball_dx = random.choice([BALL_SPEED, -BALL_SPEED]) * \
             (1.05 ** (last_speed_increase // 100))
-        ball_dy = -4 * (1.05 ** (last_speed_increase // 100))
+        ball_dy = -BALL_SPEED * (1.05 ** (last_speed_increase // 100))
+
+
+def game_loop():
+    global last_frame_time, physics_accumulator, life_charges, charge_spawn_timer, last_logged_frame_id, last_checkpoint
+    if not game_started:
+        last_frame_time = None
+        return
+
+    # Measure elapsed time and feed it to the fixed-step simulation
+    work_start = time.perf_counter()
+    now = game_clock()
+    if last_frame_time is None:
+        last_frame_time = now
+    physics_accumulator += min(now - last_frame_time, MAX_FRAME_TIME)
+    last_frame_time = now
+
+    quality = quality_governor.settings
+    nose_tracker.min_interval = quality["tracker_interval"]
+
+    pending_latency = None
+    sample = nose_tracker.get_nose_sample()
+    if sample is not None:
+        nose_x, frame_id, captured_at, inferred_at = sample
+        # Double the nose offset from the frame centre, as measured on a
+        # 640 px camera, so small head turns cover the whole paddle range
+        screen_x = (nose_x - nose_tracker.frame_width / 2) * \
+            NOSE_GAIN * 640 / nose_tracker.frame_width
+
+        move_paddle(screen_x, 0)  # Move paddle based on nose position
+        if latency_log and frame_id != last_logged_frame_id:
+            last_logged_frame_id = frame_id
+            pending_latency = (frame_id, captured_at, inferred_at,
+                               time.perf_counter())
+
+    while physics_accumulator >= PHYSICS_DT:
+        step_physics(PHYSICS_DT)
+        physics_accumulator -= PHYSICS_DT
+        if lives == 0 or not bricks:
+            break
+    if (spectator_publisher and spectator_publisher.clients) or video_recorder:
+        state = current_game_state()
+        if spectator_publisher:
+            spectator_publisher.publish(state)
+        if video_recorder:
+            video_recorder.record(state, now)
+
+    if SNAPSHOT_PATH and (lives == 0 or not bricks):
+        snapshot.discard(SNAPSHOT_PATH)  # Finished games aren't resumed
+    elif SNAPSHOT_PATH and now - last_checkpoint >= CHECKPOINT_INTERVAL:
+        snapshot.save(SNAPSHOT_PATH, take_snapshot())
+        last_checkpoint = now
 
     if lives == 0:
+        last_frame_time = None
+        physics_accumulator = 0.0
         for brick in bricks:
             brick.hideturtle()
         ball_pixels.clear()
@@ -874,8 +1352,12 @@ def game_loop():
         draw_button(0, -100, 100, 40, "Restart")
         screen.onclick(check_button_click)
         screen.update()
+        if soak_monitor:
+            screen.ontimer(soak_restart, 0)
         return
     if not bricks:
+        last_frame_time = None
+        physics_accumulator = 0.0
         for brick in bricks:
             brick.hideturtle()
         ball_pixels.clear()
@@ -889,21 +1371,51 @@ def game_loop():
         draw_button(0, -100, 100, 40, "Restart")
         screen.onclick(check_button_click)
         screen.update()
+        if soak_monitor:
+            screen.ontimer(soak_restart, 0)
         return
 
+    # Render between the previous and current physics states
+    render_frame(physics_accumulator / PHYSICS_DT, quality["ball_points"])
+    draw_hud(now, quality["hud_interval"])
     screen.update()
-    screen.ontimer(game_loop, 1000 // 60)
+    quality_governor.frame(time.perf_counter() - work_start)
+    if pending_latency:
+        latency_log.record(*pending_latency, time.perf_counter())
+    if soak_monitor:
+        soak_monitor.frame(time.perf_counter() - work_start)
+        if soak_monitor.finished:
+            soak_monitor.report()
+            on_close()
+            return
+        screen.ontimer(game_loop, 1)
+    else:
+        screen.ontimer(game_loop, FRAME_INTERVAL_MS)
 
     for charge in life_charges:
-        charge.turtle.hideturtle()
+        if not charge.collected:  # Collected charges already released theirs
+            release_sprite(charge.turtle)
     life_charges = []
     charge_spawn_timer = 0
 
 
+def soak_restart():
+    restart_game()
+    start_game()
+
+
 def on_close():
     global game_started
+    if SNAPSHOT_PATH and game_started and lives and bricks:
+        snapshot.save(SNAPSHOT_PATH, take_snapshot())
     game_started = False
     nose_tracker.stop()  # Stop the nose tracker when closing
+    if latency_log:
+        latency_log.close()
+    if spectator_publisher:
+        spectator_publisher.close()
+    if video_recorder:
+        video_recorder.close()
     screen.bye()
 
 
@@ -911,6 +1423,13 @@ screen.getcanvas().winfo_toplevel().protocol("WM_DELETE_WINDOW", on_close)
 
 # Initialize game
 stars = [Star() for _ in range(100)]
-play_intro_animation(stars)
-show_title_screen()
+resume = snapshot.load(SNAPSHOT_PATH) if SNAPSHOT_PATH else None
+if soak_monitor or resume:
+    show_title_screen()
+    start_game(resume)
+else:
+    play_intro_animation(stars)
+    show_title_screen()
 screen.mainloop()
+if soak_monitor:
+    sys.exit(soak_monitor.exit_code)
@@ -0,0 +1,344 @@
+"""pygame display backend, selected with BREAKOUT_DISPLAY=pygame.
+
+Implements the part of the turtle API main.py uses on top of a pygame
+surface, so the same game state, input and game loop drive either front
+end. Each turtle keeps a retained list of fills, lines, dots and text that
+is redrawn on update(), and layers that stop changing are cached as
+surfaces. Sprites (bricks, power.gif, powerup.gif) are built once per
+shape and blitted, and the background colour and bgpic are prebuilt into
+a single surface. Coordinates stay turtle-style: (0, 0) is the centre of
+the window and y points up.
+"""
+import time
+
+import pygame
+
+SQUARE_SIZE = 20  # Turtle's "square" shape before shapesize()
+LAYER_CACHE_ITEMS = 20  # Unchanged layers with more items are cached
+
+
+class TurtleGraphicsError(Exception):
+    pass
+
+
+class Canvas:
+    """The Tk canvas calls main.py and soak.py make, answered by the screen"""
+
+    def __init__(self, screen):
+        self.screen = screen
+
+    def winfo_toplevel(self):
+        return self
+
+    def protocol(self, name, fun):
+        if name == "WM_DELETE_WINDOW":
+            self.screen.close_handler = fun
+
+    def find_all(self):
+        return self.screen.items()
+
+
+class _Screen:
+    def __init__(self):
+        pygame.display.init()
+        pygame.font.init()
+        self.width, self.height = 800, 600
+        self.surface = pygame.display.set_mode((self.width, self.height))
+        self.background_color = "black"
+        self.background_image = None
+        self.background = None
+        self.turtles = []
+        self.shapes = {}
+        self.timers = []
+        self.click_handler = None
+        self.close_handler = None
+        self.running = True
+        self.canvas = Canvas(self)
+
+    # Window setup
+    def title(self, text):
+        pygame.display.set_caption(text)
+
+    def setup(self, width, height):
+        self.width, self.height = width, height
+        self.surface = pygame.display.set_mode((width, height))
+        self.background = None
+
+    def bgcolor(self, color):
+        self.background_color = color
+        self.background = None
+
+    def bgpic(self, name):
+        try:
+            self.background_image = pygame.image.load(name).convert()
+        except (pygame.error, FileNotFoundError) as e:
+            raise TurtleGraphicsError(str(e))
+        self.background = None
+
+    def register_shape(self, name):
+        self.shape_surface(name)
+
+    def tracer(self, n=None):
+        pass  # Frames are only ever drawn by update()
+
+    def getcanvas(self):
+        return self.canvas
+
+    # Events and timers
+    def onscreenclick(self, fun):
+        self.click_handler = fun
+
+    onclick = onscreenclick
+
+    def listen(self):
+        pass
+
+    def ontimer(self, fun, t=0):
+        self.timers.append((time.perf_counter() + t / 1000, fun))
+
+    def process_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                if self.close_handler:
+                    self.close_handler()
+                else:
+                    self.bye()
+                return
+            if (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+                    and self.click_handler):
+                x, y = event.pos
+                self.click_handler(x - self.width / 2, self.height / 2 - y)
+
+    def mainloop(self):
+        while self.running:
+            self.process_events()
+            now = time.perf_counter()
+            due = [timer for timer in self.timers if timer[0] <= now]
+            self.timers = [timer for timer in self.timers if timer[0] > now]
+            for _, fun in due:
+                if self.running:
+                    fun()
+            if not due and self.running:
+                next_due = min((timer[0] for timer in self.timers), default=now + 0.01)
+                time.sleep(max(0.0, min(next_due - now, 0.01)))
+
+    def bye(self):
+        self.running = False
+        self.timers.clear()
+        pygame.display.quit()
+
+    # Drawing
+    def to_screen(self, x, y):
+        return x + self.width / 2, self.height / 2 - y
+
+    def shape_surface(self, name, stretch=(1, 1), fill="black", pen="black"):
+        key = (name, stretch, fill, pen) if name == "square" else name
+        surface = self.shapes.get(key)
+        if surface is None:
+            if name == "square":
+                surface = pygame.Surface(
+                    (round(SQUARE_SIZE * stretch[1]), round(SQUARE_SIZE * stretch[0])))
+                surface.fill(fill)
+                pygame.draw.rect(surface, pen, surface.get_rect(), 1)
+            else:
+                try:
+                    surface = pygame.image.load(name).convert_alpha()
+                except (pygame.error, FileNotFoundError):
+                    raise TurtleGraphicsError(f"There is no shape named {name}")
+            self.shapes[key] = surface
+        return surface
+
+    def build_background(self):
+        self.background = pygame.Surface((self.width, self.height))
+        self.background.fill(self.background_color)
+        if self.background_image:
+            self.background.blit(self.background_image, self.background_image.get_rect(
+                center=(self.width // 2, self.height // 2)))
+
+    def items(self):
+        items = []
+        for t in self.turtles:
+            items.extend(t.items)
+            if t.visible:
+                items.append(t)
+        return items
+
+    def update(self):
+        if not self.running:
+            return
+        self.process_events()
+        if not self.running:
+            return
+        if self.background is None:
+            self.build_background()
+        self.surface.blit(self.background, (0, 0))
+        for t in self.turtles:
+            t.draw_layer(self.surface)
+        for t in self.turtles:
+            if t.visible and t.shape_name != "classic":
+                t.draw_sprite(self.surface)
+        pygame.display.flip()
+
+
+_screen = None
+_fonts = {}
+
+
+def Screen():
+    global _screen
+    if _screen is None:
+        _screen = _Screen()
+    return _screen
+
+
+class Turtle:
+    def __init__(self):
+        self.screen = Screen()
+        self.screen.turtles.append(self)
+        self.x, self.y = 0.0, 0.0
+        self.pen_down = True
+        self.pen_color = "black"
+        self.fill_color = "black"
+        self.visible = True
+        self.shape_name = "classic"
+        self.stretch = (1, 1)
+        self.fill_points = None
+        self.items = []
+        self.version = 0  # Bumped whenever items change
+        self.drawn_version = -1
+        self.cache = None
+        self.cache_version = -1
+
+    # Pen and state
+    def penup(self):
+        self.pen_down = False
+
+    def pendown(self):
+        self.pen_down = True
+
+    def speed(self, speed=None):
+        pass
+
+    def setundobuffer(self, size):
+        pass  # Nothing is recorded for undo
+
+    def hideturtle(self):
+        self.visible = False
+
+    def showturtle(self):
+        self.visible = True
+
+    def isvisible(self):
+        return self.visible
+
+    def shape(self, name=None):
+        if name is None:
+            return self.shape_name
+        if name not in ("square", "classic"):
+            self.screen.shape_surface(name)
+        self.shape_name = name
+
+    def shapesize(self, stretch_wid=1, stretch_len=None):
+        self.stretch = (stretch_wid, stretch_len if stretch_len is not None else stretch_wid)
+
+    def color(self, *args):
+        if len(args) == 1:
+            self.pen_color = self.fill_color = args[0]
+        elif len(args) == 2:
+            self.pen_color, self.fill_color = args
+
+    def fillcolor(self, color):
+        self.fill_color = color
+
+    def xcor(self):
+        return self.x
+
+    def ycor(self):
+        return self.y
+
+    # Drawing
+    def add_item(self, item):
+        self.items.append(item)
+        self.version += 1
+
+    def goto(self, x, y=None):
+        if y is None:
+            x, y = x
+        if self.pen_down:
+            self.add_item(("line", self.pen_color, (self.x, self.y), (x, y)))
+        self.x, self.y = x, y
+        if self.fill_points is not None:
+            self.fill_points.append((x, y))
+
+    def begin_fill(self):
+        self.fill_points = [(self.x, self.y)]
+
+    def end_fill(self):
+        if self.fill_points and len(self.fill_points) > 2:
+            self.add_item(("polygon", self.fill_color, self.fill_points))
+        self.fill_points = None
+
+    def dot(self, size=None, color=None):
+        self.add_item(("dot", color or self.pen_color, (self.x, self.y),
+                       max(1, (size or 5) / 2)))
+
+    def write(self, text, move=False, align="left", font=("Arial", 8, "normal")):
+        if font not in _fonts:
+            family, size, style = font
+            _fonts[font] = pygame.font.SysFont(family, size, bold="bold" in style)
+        lines = [_fonts[font].render(line, True, self.pen_color)
+                 for line in text.split("\n")]
+        self.add_item(("text", (self.x, self.y), align, lines))
+
+    def clear(self):
+        self.items = []
+        self.version += 1
+        self.cache = None
+
+    # Rendering
+    def draw_layer(self, surface):
+        if not self.items:
+            self.drawn_version = self.version
+            return
+        if self.cache is not None and self.cache_version == self.version:
+            surface.blit(self.cache, (0, 0))
+            return
+        if self.drawn_version == self.version and len(self.items) > LAYER_CACHE_ITEMS:
+            # Unchanged since the last frame: keep it as one surface from now on
+            self.cache = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            self.draw_items(self.cache)
+            self.cache_version = self.version
+            surface.blit(self.cache, (0, 0))
+            return
+        self.draw_items(surface)
+        self.drawn_version = self.version
+
+    def draw_items(self, surface):
+        to_screen = self.screen.to_screen
+        for item in self.items:
+            kind = item[0]
+            if kind == "polygon":
+                pygame.draw.polygon(surface, item[1], [to_screen(x, y) for x, y in item[2]])
+            elif kind == "line":
+                pygame.draw.line(surface, item[1], to_screen(*item[2]), to_screen(*item[3]))
+            elif kind == "dot":
+                pygame.draw.circle(surface, item[1], to_screen(*item[2]), item[3])
+            elif kind == "text":
+                x, y = to_screen(*item[1])
+                align, lines = item[2], item[3]
+                # Like Tk's text anchor, the block sits above the pen position
+                y -= sum(line.get_height() for line in lines)
+                for line in lines:
+                    if align == "center":
+                        left = x - line.get_width() / 2
+                    elif align == "right":
+                        left = x - line.get_width()
+                    else:
+                        left = x
+                    surface.blit(line, (left, y))
+                    y += line.get_height()
+
+    def draw_sprite(self, surface):
+        sprite = self.screen.shape_surface(
+            self.shape_name, self.stretch, self.fill_color, self.pen_color)
+        surface.blit(sprite, sprite.get_rect(center=self.screen.to_screen(self.x, self.y)))
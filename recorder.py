@@ -0,0 +1,151 @@
+"""Gameplay video export, enabled with BREAKOUT_RECORD=clip.mp4.
+
+record() only queues the compact per-frame state tuple (see
+spectator.game_state()). A background thread rasterizes it straight into
+a NumPy image with OpenCV, without touching the on-screen canvas, and
+encodes it with cv2.VideoWriter. Frames are emitted on the game clock, not
+the wall clock, so headless replays can record faster than real time. When
+the encoder falls behind, new frames are dropped and counted instead of
+blocking game_loop().
+"""
+import queue
+import threading
+
+import cv2
+import numpy as np
+import pygame
+
+import spectator
+
+RECORD_FPS = 60
+RECORD_QUEUE_SIZE = 120  # Frames waiting for the encoder before dropping
+RECORD_FOURCC = "mp4v"
+RECORD_MAX_GAP = 0.25  # Seconds of game time to fill in after a pause
+WIDTH, HEIGHT = 800, 600
+BRICK_COLOR = (0, 0, 205)  # red3, in BGR
+SCORE_COLOR = (0, 255, 255)  # yellow
+
+
+class RecorderError(Exception):
+    pass
+
+
+def load_sprite(path):
+    """Return a BGR image and boolean opacity mask, or None if unreadable"""
+    try:
+        surface = pygame.image.load(path)
+    except (pygame.error, FileNotFoundError):
+        return None
+    image = pygame.surfarray.array3d(surface).transpose(1, 0, 2)[:, :, ::-1].copy()
+    opaque = ((pygame.surfarray.array_alpha(surface) > 0) &
+              (pygame.surfarray.array_colorkey(surface) > 0)).T
+    return image, opaque
+
+
+def blit(frame, sprite, x, y):
+    """Draw a sprite centred on (x, y) in image coordinates, clipped to frame"""
+    image, opaque = sprite
+    h, w = opaque.shape
+    left, top = int(round(x)) - w // 2, int(round(y)) - h // 2
+    x0, y0 = max(left, 0), max(top, 0)
+    x1, y1 = min(left + w, frame.shape[1]), min(top + h, frame.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    mask = opaque[y0 - top:y1 - top, x0 - left:x1 - left]
+    frame[y0:y1, x0:x1][mask] = image[y0 - top:y1 - top, x0 - left:x1 - left][mask]
+
+
+def to_image(x, y):
+    return int(round(x + WIDTH / 2)), int(round(HEIGHT / 2 - y))
+
+
+class FrameRasterizer:
+    def __init__(self, background="background.gif", icon="power.gif",
+                 powerup="powerup.gif"):
+        self.background = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        loaded = load_sprite(background)
+        if loaded:
+            image = loaded[0][:HEIGHT, :WIDTH]
+            self.background[:image.shape[0], :image.shape[1]] = image
+        self.icon = load_sprite(icon)
+        self.powerup = load_sprite(powerup) or self.icon
+        self.frame = np.empty_like(self.background)
+
+    def draw(self, state):
+        """Rasterize a state tuple into self.frame, which is reused"""
+        ball, paddle_x, brick_mask, pickups, score, lives = state
+        frame = self.frame
+        np.copyto(frame, self.background)
+
+        for index in range(spectator.BRICK_ROWS * spectator.BRICK_COLS):
+            if brick_mask >> index & 1:
+                row, col = divmod(index, spectator.BRICK_COLS)
+                x = -395 + col * (spectator.BRICK_WIDTH + spectator.BRICK_SPACING) + \
+                    spectator.BRICK_WIDTH / 2
+                y = spectator.BRICK_START_Y - \
+                    row * (spectator.BRICK_HEIGHT + spectator.BRICK_SPACING)
+                cv2.rectangle(frame,
+                              to_image(x - spectator.BRICK_WIDTH / 2, y + spectator.BRICK_HEIGHT / 2),
+                              to_image(x + spectator.BRICK_WIDTH / 2, y - spectator.BRICK_HEIGHT / 2),
+                              BRICK_COLOR, cv2.FILLED)
+
+        cv2.rectangle(frame, to_image(paddle_x - 50, -240), to_image(paddle_x + 50, -260),
+                      (255, 255, 255), cv2.FILLED)
+        cv2.circle(frame, to_image(*ball), 5, (255, 255, 255), cv2.FILLED, cv2.LINE_AA)
+
+        for kind, x, y in pickups:
+            sprite = self.powerup if kind == spectator.POWERUP else self.icon
+            if sprite:
+                blit(frame, sprite, *to_image(x, y))
+            else:
+                cv2.circle(frame, to_image(x, y), 12, (0, 215, 255), cv2.FILLED)
+        if self.icon:
+            for i in range(lives):
+                blit(frame, self.icon, *to_image(300 + i * 40, 260))
+
+        cv2.putText(frame, f"Score: {score}", to_image(-350, 250),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, SCORE_COLOR, 2, cv2.LINE_AA)
+        return frame
+
+
+class VideoRecorder:
+    def __init__(self, path, fps=RECORD_FPS):
+        self.fps = fps
+        self.writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*RECORD_FOURCC),
+                                      fps, (WIDTH, HEIGHT))
+        if not self.writer.isOpened():
+            raise RecorderError(
+                f"Can't write {path} with the {RECORD_FOURCC} codec")
+        self.rasterizer = FrameRasterizer()
+        self.frames = queue.Queue(maxsize=RECORD_QUEUE_SIZE)
+        self.next_frame_time = None
+        self.written = 0
+        self.dropped = 0
+        self.thread = threading.Thread(target=self._encode, daemon=True)
+        self.thread.start()
+
+    def record(self, state, game_time):
+        """Queue state for every video frame due by game_time. Never blocks."""
+        if self.next_frame_time is None or \
+                game_time - self.next_frame_time > RECORD_MAX_GAP:
+            self.next_frame_time = game_time  # Skip pauses between games
+        while self.next_frame_time <= game_time:
+            self.next_frame_time += 1 / self.fps
+            try:
+                self.frames.put_nowait(state)
+            except queue.Full:
+                self.dropped += 1
+
+    def _encode(self):
+        while True:
+            state = self.frames.get()
+            if state is None:
+                return
+            self.writer.write(self.rasterizer.draw(state))
+            self.written += 1
+
+    def close(self):
+        self.frames.put(None)  # Let the encoder drain what is queued
+        self.thread.join()
+        self.writer.release()
+        print(f"Recorded {self.written} frames, dropped {self.dropped}")
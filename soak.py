@@ -0,0 +1,118 @@
+"""Long-run soak test: plays the game unattended for hours of simulated time
+and fails if memory, canvas items or frame time keep growing.
+
+    python soak.py [SIMULATED_HOURS]
+
+Runs main.py with BREAKOUT_SOAK set, so an autopilot replaces the camera and
+every frame advances a simulated clock instead of the wall clock. Audio uses
+SDL's dummy driver, and without a DISPLAY the run is re-launched under
+xvfb-run when it is available.
+"""
+import os
+import runpy
+import shutil
+import sys
+import tracemalloc
+
+SOAK_FRAME_TIME = 1 / 60  # Simulated seconds per frame
+WARMUP = 120  # Simulated seconds before the baseline sample
+SAMPLE_INTERVAL = 60  # Simulated seconds between samples
+# Allowed value per metric: baseline * factor + slack
+THRESHOLDS = {
+    "python_heap_mb": (1.25, 2.0),
+    "rss_mb": (1.25, 32.0),
+    "canvas_items": (1.0, 50),
+    "frame_ms": (2.0, 5.0),
+}
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        try:
+            import resource
+        except ImportError:
+            return 0.0
+        # Peak rather than current RSS, but still catches steady growth
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class SoakMonitor:
+    def __init__(self, duration, canvas):
+        self.duration = duration
+        self.canvas = canvas
+        self.sim_time = 0.0
+        self.next_sample = WARMUP
+        self.frame_times = []
+        self.baseline = None
+        self.samples = []
+        self.failures = []
+        self.finished = False
+        tracemalloc.start()
+
+    def clock(self):
+        """Replaces time.perf_counter() in game_loop"""
+        self.sim_time += SOAK_FRAME_TIME
+        return self.sim_time
+
+    def frame(self, seconds):
+        """Record the real cost of one game_loop() call"""
+        self.frame_times.append(seconds)
+        if self.sim_time >= self.next_sample:
+            self.sample()
+            self.next_sample += SAMPLE_INTERVAL
+        if self.sim_time >= self.duration or self.failures:
+            self.finished = True
+
+    def sample(self):
+        frame_times = sorted(self.frame_times)
+        self.frame_times.clear()
+        sample = {
+            "python_heap_mb": tracemalloc.get_traced_memory()[0] / 2**20,
+            "rss_mb": rss_mb(),
+            "canvas_items": len(self.canvas.find_all()),
+            "frame_ms": frame_times[len(frame_times) // 2] * 1000 if frame_times else 0.0,
+        }
+        self.samples.append((self.sim_time, sample))
+        print(f"[soak] {self.sim_time / 60:7.1f} min  " +
+              "  ".join(f"{name} {value:.2f}" for name, value in sample.items()))
+
+        if self.baseline is None:
+            self.baseline = sample
+            return
+        for name, (factor, slack) in THRESHOLDS.items():
+            limit = self.baseline[name] * factor + slack
+            if sample[name] > limit:
+                self.failures.append(
+                    f"{name} grew to {sample[name]:.2f} (baseline "
+                    f"{self.baseline[name]:.2f}, limit {limit:.2f}) "
+                    f"after {self.sim_time / 60:.1f} simulated minutes")
+
+    @property
+    def exit_code(self):
+        return 1 if self.failures else 0
+
+    def report(self):
+        tracemalloc.stop()
+        if self.failures:
+            print("[soak] FAILED")
+            for failure in self.failures:
+                print(f"[soak]   {failure}")
+        else:
+            print(f"[soak] passed: {self.sim_time / 3600:.2f} simulated hours, "
+                  f"{len(self.samples)} samples")
+
+
+if __name__ == "__main__":
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY") \
+            and shutil.which("xvfb-run"):
+        os.execvp("xvfb-run", ["xvfb-run", "-a", sys.executable] + sys.argv)
+
+    os.environ["BREAKOUT_SOAK"] = str(hours * 3600)
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))  # Assets are relative
+    runpy.run_path("main.py", run_name="__main__")
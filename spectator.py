@@ -0,0 +1,324 @@
+"""Mirror a live game to a second screen.
+
+Run the game with BREAKOUT_SPECTATOR=127.0.0.1:5050 (or a filesystem path for
+a Unix socket) and start a viewer with:
+
+    python spectator.py 127.0.0.1:5050
+
+Every message is a keyframe holding the full state, or a delta holding only
+the fields that differ from the last keyframe, so a viewer only ever needs
+the latest keyframe to rebuild a frame.
+"""
+import os
+import queue
+import socket
+import struct
+import sys
+import threading
+import turtle
+
+KEYFRAME = 0
+DELTA = 1
+KEYFRAME_INTERVAL = 120  # Published frames between keyframes
+SEND_QUEUE_SIZE = 4  # Messages waiting for the sender thread before dropping
+SEND_TIMEOUT = 0.25  # Seconds a viewer may stall a send before it is dropped
+
+# Field bits, in encoding order
+BALL = 1
+PADDLE = 2
+BRICKS = 4
+PICKUPS = 8
+SCORE = 16
+LIVES = 32
+ALL_FIELDS = BALL | PADDLE | BRICKS | PICKUPS | SCORE | LIVES
+
+LENGTH = struct.Struct("<H")  # Prefixes every message on the stream
+HEADER = struct.Struct("<BIB")  # Type, frame, field mask
+POINT = struct.Struct("<hh")
+PADDLE_X = struct.Struct("<h")
+MASK = struct.Struct("<Q")
+COUNT = struct.Struct("<B")
+PICKUP = struct.Struct("<Bhh")  # Kind, x, y
+SCORE_VALUE = struct.Struct("<I")
+LIVES_VALUE = struct.Struct("<B")
+
+# Pickup kinds
+POWERUP = 0
+CHARGE = 1
+
+# Mirrors the brick layout in main.py
+BRICK_ROWS, BRICK_COLS = 5, 10
+BRICK_WIDTH, BRICK_HEIGHT, BRICK_SPACING = 70, 30, 10
+BRICK_START_Y = 150
+
+
+def game_state(ball, paddle_x, brick_mask, pickups, score, lives):
+    """Quantize a frame into the tuple layout the encoder compares"""
+    return (
+        (int(round(ball[0])), int(round(ball[1]))),
+        int(round(paddle_x)),
+        brick_mask,
+        tuple((kind, int(round(x)), int(round(y))) for kind, x, y in pickups),
+        score,
+        lives,
+    )
+
+
+def encode_fields(state, mask):
+    ball, paddle_x, brick_mask, pickups, score, lives = state
+    parts = []
+    if mask & BALL:
+        parts.append(POINT.pack(*ball))
+    if mask & PADDLE:
+        parts.append(PADDLE_X.pack(paddle_x))
+    if mask & BRICKS:
+        parts.append(MASK.pack(brick_mask))
+    if mask & PICKUPS:
+        pickups = pickups[:255]
+        parts.append(COUNT.pack(len(pickups)))
+        parts.extend(PICKUP.pack(*pickup) for pickup in pickups)
+    if mask & SCORE:
+        parts.append(SCORE_VALUE.pack(score))
+    if mask & LIVES:
+        parts.append(LIVES_VALUE.pack(lives))
+    return b"".join(parts)
+
+
+def decode(message, keyframe):
+    """Rebuild a full state from a message (without its length prefix) and
+    the last keyframe. Returns (type, state); state is None for a delta
+    that arrives before any keyframe."""
+    kind, _, mask = HEADER.unpack_from(message)
+    if kind == DELTA and keyframe is None:
+        return kind, None
+    state = list(keyframe) if kind == DELTA else [None] * 6
+    offset = HEADER.size
+    if mask & BALL:
+        state[0] = POINT.unpack_from(message, offset)
+        offset += POINT.size
+    if mask & PADDLE:
+        state[1] = PADDLE_X.unpack_from(message, offset)[0]
+        offset += PADDLE_X.size
+    if mask & BRICKS:
+        state[2] = MASK.unpack_from(message, offset)[0]
+        offset += MASK.size
+    if mask & PICKUPS:
+        count = COUNT.unpack_from(message, offset)[0]
+        offset += COUNT.size
+        pickups = []
+        for _ in range(count):
+            pickups.append(PICKUP.unpack_from(message, offset))
+            offset += PICKUP.size
+        state[3] = tuple(pickups)
+    if mask & SCORE:
+        state[4] = SCORE_VALUE.unpack_from(message, offset)[0]
+        offset += SCORE_VALUE.size
+    if mask & LIVES:
+        state[5] = LIVES_VALUE.unpack_from(message, offset)[0]
+    return kind, tuple(state)
+
+
+def open_socket(address):
+    """'host:port' is TCP, anything else is a Unix socket path"""
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit():
+        return socket.socket(socket.AF_INET, socket.SOCK_STREAM), (host, int(port))
+    return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM), address
+
+
+class StatePublisher:
+    """Encodes frames on the caller's thread and sends them on a background
+    thread. When the sender falls behind, the queued backlog is dropped and
+    streaming restarts from a keyframe rather than ever blocking."""
+
+    def __init__(self, address):
+        self.server, bind_address = open_socket(address)
+        if self.server.family == socket.AF_INET:
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        elif os.path.exists(bind_address):
+            os.unlink(bind_address)  # Stale socket from a previous run
+        self.server.bind(bind_address)
+        self.server.listen()
+        self.clients = []
+        self.clients_lock = threading.Lock()
+        self.need_keyframe = True
+        self.keyframe = None
+        self.last_sent = None
+        self.frame = 0
+        self.frames_since_keyframe = 0
+        self.dropped = 0
+        self.messages = queue.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.running = True
+        threading.Thread(target=self._accept, daemon=True).start()
+        threading.Thread(target=self._send, daemon=True).start()
+
+    def publish(self, state):
+        self.frame += 1
+        if not self.clients:
+            return
+        if self.messages.full():
+            # The backlog may hold the keyframe its deltas depend on, so
+            # discard all of it and resynchronize viewers with a new one
+            while True:
+                try:
+                    self.messages.get_nowait()
+                except queue.Empty:
+                    break
+                self.dropped += 1
+            self.need_keyframe = True
+        if self.need_keyframe or self.frames_since_keyframe >= KEYFRAME_INTERVAL:
+            self.need_keyframe = False
+            self.keyframe = state
+            self.frames_since_keyframe = 0
+            kind, mask = KEYFRAME, ALL_FIELDS
+        else:
+            self.frames_since_keyframe += 1
+            kind, mask = DELTA, 0
+            for bit, value, key_value in zip(
+                    (BALL, PADDLE, BRICKS, PICKUPS, SCORE, LIVES), state, self.keyframe):
+                if value != key_value:
+                    mask |= bit
+            if (kind, mask, state) == self.last_sent:
+                return  # Nothing moved since the previous message
+        self.last_sent = (kind, mask, state)
+
+        body = encode_fields(state, mask)
+        message = (LENGTH.pack(HEADER.size + len(body)) +
+                   HEADER.pack(kind, self.frame & 0xFFFFFFFF, mask) + body)
+        self.messages.put_nowait(message)
+
+    def _accept(self):
+        while self.running:
+            try:
+                client, _ = self.server.accept()
+            except OSError:
+                return
+            client.settimeout(SEND_TIMEOUT)
+            with self.clients_lock:
+                self.clients.append(client)
+            self.need_keyframe = True
+
+    def _send(self):
+        while self.running:
+            message = self.messages.get()
+            if message is None:
+                return
+            with self.clients_lock:
+                clients = list(self.clients)
+            # Send without the lock so a slow viewer can't hold up _accept()
+            for client in clients:
+                try:
+                    client.sendall(message)
+                except OSError:
+                    # Includes timeouts, after which the stream may end
+                    # mid-message, so the viewer can't be kept
+                    self._remove_client(client)
+
+    def _remove_client(self, client):
+        with self.clients_lock:
+            if client in self.clients:
+                self.clients.remove(client)
+        client.close()
+
+    def close(self):
+        self.running = False
+        self.server.close()
+        try:
+            self.messages.put_nowait(None)
+        except queue.Full:
+            pass
+        with self.clients_lock:
+            for client in self.clients:
+                client.close()
+            self.clients.clear()
+
+
+def read_messages(buffer):
+    """Split complete messages off the front of buffer (a bytearray)"""
+    messages = []
+    while len(buffer) >= LENGTH.size:
+        length = LENGTH.unpack_from(buffer)[0]
+        if len(buffer) < LENGTH.size + length:
+            break
+        messages.append(bytes(buffer[LENGTH.size:LENGTH.size + length]))
+        del buffer[:LENGTH.size + length]
+    return messages
+
+
+def run_viewer(address):
+    sock, connect_address = open_socket(address)
+    sock.connect(connect_address)
+    sock.setblocking(False)
+
+    screen = turtle.Screen()
+    screen.title("Breakout Spectator")
+    screen.bgcolor("black")
+    screen.setup(width=800, height=600)
+    screen.tracer(0)
+    pen = turtle.Turtle()
+    pen.hideturtle()
+    pen.penup()
+    pen.setundobuffer(None)
+
+    buffer = bytearray()
+    keyframe = None
+    latest = None
+
+    def rectangle(x, y, width, height, color):
+        pen.goto(x - width / 2, y - height / 2)
+        pen.color(color)
+        pen.begin_fill()
+        for dx, dy in ((width, 0), (0, height), (-width, 0), (0, -height)):
+            pen.goto(pen.xcor() + dx, pen.ycor() + dy)
+        pen.end_fill()
+
+    def draw(state):
+        ball, paddle_x, brick_mask, pickups, score, lives = state
+        pen.clear()
+        for index in range(BRICK_ROWS * BRICK_COLS):
+            if brick_mask >> index & 1:
+                row, col = divmod(index, BRICK_COLS)
+                x = -395 + col * (BRICK_WIDTH + BRICK_SPACING) + BRICK_WIDTH / 2
+                y = BRICK_START_Y - row * (BRICK_HEIGHT + BRICK_SPACING)
+                rectangle(x, y, BRICK_WIDTH, BRICK_HEIGHT, "red3")
+        rectangle(paddle_x, -250, 100, 20, "white")
+        pen.goto(ball)
+        pen.dot(10, "white")
+        for kind, x, y in pickups:
+            pen.goto(x, y)
+            pen.dot(16, "gold" if kind == POWERUP else "cyan")
+        pen.goto(-350, 250)
+        pen.color("yellow")
+        pen.write(f"Score: {score}   Lives: {lives}",
+                  font=("Fridericka the Great", 16, "bold"))
+        screen.update()
+
+    def poll():
+        nonlocal keyframe, latest
+        try:
+            data = sock.recv(65536)
+            if not data:
+                screen.bye()
+                return
+            buffer.extend(data)
+        except BlockingIOError:
+            pass
+        for message in read_messages(buffer):
+            kind, state = decode(message, keyframe)
+            if kind == KEYFRAME:
+                keyframe = state
+            if state is not None:
+                latest = state
+        if latest is not None:
+            draw(latest)
+            latest = None
+        screen.ontimer(poll, 1000 // 60)
+
+    poll()
+    screen.mainloop()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python spectator.py ADDRESS")
+    run_viewer(sys.argv[1])